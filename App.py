@@ -11,12 +11,16 @@ Features:
 - Reschedule UI to move hours between days
 - Reminders for today's blocks (in-app popups)
 - Persistence of subjects, availability, and last generated schedule in JSON
+  (the schedule lives in its own file so small edits don't rewrite it)
 """
 
 import os
 import json
+import bisect
 import datetime
-from collections import OrderedDict
+import heapq
+import threading
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox
 
@@ -24,16 +28,26 @@ from tkinter import ttk, simpledialog, messagebox
 # Data persistence helpers
 # -------------------------
 DATA_FILE = "study_planner_data.json"
+SCHEDULE_FILE = "study_planner_schedule.json"
+# Availability keys, indexed by date.weekday()
+WDAYS = ("Mon","Tue","Wed","Thu","Fri","Sat","Sun")
 
 def today_date():
     return datetime.date.today()
 
-def parse_date(s):
+@lru_cache(maxsize=4096)
+def _parse_date_cached(s):
     try:
         return datetime.datetime.strptime(s, "%Y-%m-%d").date()
     except Exception:
         return None
 
+def parse_date(s):
+    # The same deadline/day strings are parsed repeatedly; strptime is slow
+    if s is None:
+        return None
+    return _parse_date_cached(str(s))
+
 def load_data():
     if not os.path.exists(DATA_FILE):
         return {"subjects": {}, "availability": {}}
@@ -44,10 +58,95 @@ def load_data():
             # Corrupted file fallback
             return {"subjects": {}, "availability": {}}
 
-def save_data(data):
+def _write_json_atomic(path, obj):
     # Ensure JSON serializable: convert any non-serializable objects if needed
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    # Write to a temp file and rename so a crash mid-write can't corrupt the data
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(obj, f, indent=2, default=str)
+    os.replace(tmp, path)
+
+def save_data(data):
+    _write_json_atomic(DATA_FILE, data)
+
+def load_schedule():
+    if not os.path.exists(SCHEDULE_FILE):
+        return {}
+    with open(SCHEDULE_FILE, "r") as f:
+        try:
+            saved = json.load(f)
+        except Exception:
+            return {}
+    return saved if isinstance(saved, dict) else {}
+
+def save_schedule(schedule_dict):
+    _write_json_atomic(SCHEDULE_FILE, schedule_dict)
+
+def blocks_from_json(blocks):
+    """
+    Convert one saved schedule day to the {subject: hours} form.
+    Older files stored each day as a list of {'subject', 'hours'} entries.
+    """
+    if isinstance(blocks, dict):
+        return {str(s): float(h) for s, h in blocks.items()}
+    out = {}
+    for e in blocks:
+        out[e['subject']] = round(out.get(e['subject'], 0) + float(e['hours']), 2)
+    return out
+
+# Per-field checks applied to every saved subject. The validator below is
+# generated from this schema once at import, with the defaults and bounds
+# inlined, so loading a large plan runs straight-line code per subject.
+# - deadline: YYYY-MM-DD string; if missing/invalid set to today +7
+# - difficulty: 1-5, required_hours: float >=0
+# - score and past_hours: allow None or numeric
+SUBJECT_SCHEMA = (
+    ('deadline', 'date', {}),
+    ('difficulty', 'int_range', {'lo': 1, 'hi': 5, 'default': 3}),
+    ('required_hours', 'float_min', {'lo': 0, 'default': 2.0}),
+    ('score', 'optional', {'cast': 'int'}),
+    ('past_hours', 'optional', {'cast': 'float'}),
+)
+
+_FIELD_TEMPLATES = {
+    'date': (
+        "    x = get({key!r})\n"
+        "    v[{key!r}] = default_deadline if x is None or parse_date(str(x)) is None else str(x)\n"
+    ),
+    'int_range': (
+        "    try:\n"
+        "        x = int(get({key!r}))\n"
+        "        v[{key!r}] = x if {lo} <= x <= {hi} else {default!r}\n"
+        "    except Exception:\n"
+        "        v[{key!r}] = {default!r}\n"
+    ),
+    'float_min': (
+        "    try:\n"
+        "        x = float(get({key!r}))\n"
+        "        v[{key!r}] = {default!r} if x < {lo} else x\n"
+        "    except Exception:\n"
+        "        v[{key!r}] = {default!r}\n"
+    ),
+    'optional': (
+        "    x = get({key!r})\n"
+        "    if x is not None:\n"
+        "        try:\n"
+        "            x = {cast}(x)\n"
+        "        except Exception:\n"
+        "            x = None\n"
+        "    v[{key!r}] = x\n"
+    ),
+}
+
+def _compile_subject_validator(schema):
+    lines = ["def _validate_subject(v, default_deadline):", "    get = v.get"]
+    for key, kind, params in schema:
+        lines.append(_FIELD_TEMPLATES[kind].format(key=key, **params))
+    ns = {'parse_date': parse_date}
+    exec("\n".join(lines), ns)
+    return ns['_validate_subject']
+
+_validate_subject = _compile_subject_validator(SUBJECT_SCHEMA)
 
 def sanitize_data(data):
     """
@@ -61,64 +160,17 @@ def sanitize_data(data):
     if 'subjects' not in data or not isinstance(data['subjects'], dict):
         data['subjects'] = {}
     # sanitize each subject
+    default_deadline = (today_date() + datetime.timedelta(days=7)).isoformat()
     for name, v in list(data['subjects'].items()):
         if not isinstance(v, dict):
             data['subjects'][name] = {}
             v = data['subjects'][name]
-        # deadline: must be YYYY-MM-DD string; if missing set to today +7
-        dd = v.get('deadline')
-        if dd is None:
-            v['deadline'] = (today_date() + datetime.timedelta(days=7)).strftime("%Y-%m-%d")
-        else:
-            # check parse
-            if parse_date(str(dd)) is None:
-                v['deadline'] = (today_date() + datetime.timedelta(days=7)).strftime("%Y-%m-%d")
-            else:
-                v['deadline'] = str(dd)
-        # difficulty: 1-5
-        diff = v.get('difficulty')
-        try:
-            if diff is None:
-                v['difficulty'] = 3
-            else:
-                v['difficulty'] = int(diff)
-                if v['difficulty'] < 1 or v['difficulty'] > 5:
-                    v['difficulty'] = 3
-        except Exception:
-            v['difficulty'] = 3
-        # required_hours: float >=0
-        rh = v.get('required_hours')
-        try:
-            if rh is None:
-                v['required_hours'] = 2.0
-            else:
-                v['required_hours'] = float(rh)
-                if v['required_hours'] < 0:
-                    v['required_hours'] = 2.0
-        except Exception:
-            v['required_hours'] = 2.0
-        # score and past_hours: allow None or numeric
-        sc = v.get('score')
-        if sc is None:
-            v['score'] = None
-        else:
-            try:
-                v['score'] = int(sc)
-            except Exception:
-                v['score'] = None
-        ph = v.get('past_hours')
-        if ph is None:
-            v['past_hours'] = None
-        else:
-            try:
-                v['past_hours'] = float(ph)
-            except Exception:
-                v['past_hours'] = None
+        _validate_subject(v, default_deadline)
 
     # availability keys: ensure Mon..Sun exist and are numeric
     if 'availability' not in data or not isinstance(data['availability'], dict):
         data['availability'] = {}
-    for wd in ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]:
+    for wd in WDAYS:
         val = data['availability'].get(wd)
         try:
             if val is None or val == "":
@@ -162,6 +214,9 @@ class SimplePredictor:
             self.model = LinearRegression()
             try:
                 self.model.fit(X, y)
+                # Keep the fitted coefficients so predictions skip sklearn's per-call overhead
+                self._c0, self._c1, self._c2 = map(float, self.model.coef_)
+                self._b = float(self.model.intercept_)
                 self.use_model = True
             except Exception:
                 self.model = None
@@ -175,10 +230,8 @@ class SimplePredictor:
             base = {1:1.5,2:2.5,3:4.0,4:6.0,5:8.0}
             return float(base.get(difficulty, 4.0))
         if self.use_model:
-            import numpy as np
-            x = np.array([[difficulty, past_score, past_hours]])
             try:
-                pred = float(self.model.predict(x)[0])
+                pred = self._c0*difficulty + self._c1*past_score + self._c2*past_hours + self._b
             except Exception:
                 pred = past_hours + 1.0
             return round(max(1.0, pred),2)
@@ -190,68 +243,142 @@ class SimplePredictor:
 # -------------------------
 # Rule-based functions
 # -------------------------
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except Exception:
+    NUMBA_AVAILABLE = False
+
 def detect_and_adjust_priorities(subjects):
-    names = list(subjects.keys())
-    names.sort(key=lambda n: subjects[n]['deadline'])
-    for i in range(len(names)-1):
-        a = names[i]
-        b = names[i+1]
-        d1 = subjects[a]['deadline']
-        d2 = subjects[b]['deadline']
-        if abs((d2-d1).days) <= 2:
-            if subjects[a]['difficulty'] < subjects[b]['difficulty']:
-                subjects[b]['priority'] +=1
-            else:
-                subjects[a]['priority'] +=1
+    arr = []
+    for n, s in subjects.items():
+        # deadlines may still be YYYY-MM-DD strings when coming straight from saved data
+        d = s['deadline'] if isinstance(s['deadline'], datetime.date) else parse_date(str(s['deadline']))
+        if d is not None:
+            arr.append((d, n))
+    arr.sort()
+    if len(arr) < 2:
+        return
+    ords = [d.toordinal() for d, _ in arr]
+    if NUMPY_AVAILABLE:
+        close = np.flatnonzero(np.diff(np.array(ords)) <= 2).tolist()
+    else:
+        close = [i for i in range(len(ords)-1) if ords[i+1]-ords[i] <= 2]
+    for i in close:
+        a = arr[i][1]
+        b = arr[i+1][1]
+        if subjects[a]['difficulty'] < subjects[b]['difficulty']:
+            subjects[b]['priority'] +=1
+        else:
+            subjects[a]['priority'] +=1
+
+def _cap_array(availability):
+    # Hours per weekday indexed by date.weekday() (Mon=0 .. Sun=6)
+    return [float(availability.get(wd,0)) for wd in WDAYS]
 
 def build_calendar_slots(availability, start_date, end_date):
-    slots = OrderedDict()
-    cur = start_date
-    while cur <= end_date:
-        weekday = cur.strftime("%a")
-        hrs = float(availability.get(weekday,0))
-        slots[cur] = hrs
-        cur += datetime.timedelta(days=1)
-    return slots
+    cap_arr = _cap_array(availability)
+    days = [start_date + datetime.timedelta(days=i) for i in range((end_date-start_date).days+1)]
+    return {d: cap_arr[d.weekday()] for d in days}
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _allocate_core(cap, req, stop):
+        """
+        Fill day capacities with subjects in the order given.
+        cap[j]: free hours per day (updated in place), req[i]/stop[i]: hours
+        and number of days up to the deadline for subject i (updated in place).
+        Returns (subject_idx, day_idx, hours) for each allocated block.
+        """
+        n_subj = req.shape[0]
+        size = n_subj * cap.shape[0]
+        out_subj = np.empty(size, np.int32)
+        out_day = np.empty(size, np.int32)
+        out_hrs = np.empty(size, np.float64)
+        n = 0
+        for i in range(n_subj):
+            r = req[i]
+            for j in range(stop[i]):
+                if r <= 0.001:
+                    break
+                a = cap[j]
+                if a <= 0.0:
+                    continue
+                take = a if a < r else r
+                cap[j] = a - take
+                r -= take
+                if take > 0.001:
+                    out_subj[n] = i
+                    out_day[n] = j
+                    out_hrs[n] = take
+                    n += 1
+            req[i] = r
+        return out_subj[:n], out_day[:n], out_hrs[:n]
+
+def warm_up_allocator():
+    # Compile (or load from cache) the numba kernel so the first Generate is not delayed
+    if not NUMBA_AVAILABLE:
+        return
+    try:
+        _allocate_core(np.zeros(1), np.zeros(1), np.zeros(1, np.int64))
+    except Exception:
+        pass
 
 def allocate_hours_to_schedule(subjects_input, availability, start_date=None):
-    if not subjects_input: return OrderedDict(), {}
+    if not subjects_input: return {}, {}
     if start_date is None: start_date = today_date()
     max_deadline = max(v['deadline'] for v in subjects_input.values())
     slots = build_calendar_slots(availability, start_date, max_deadline)
+    days = list(slots.keys())
     remaining = {name: float(data['required_hours']) for name, data in subjects_input.items()}
-    schedule = OrderedDict((d,[]) for d in slots.keys())
-    subjects_sorted = sorted(subjects_input.items(), key=lambda kv: (kv[1]['deadline'], -kv[1]['priority']))
-    for name, meta in subjects_sorted:
-        req = remaining[name]
-        for day in schedule.keys():
-            if day > meta['deadline']: break
-            used = sum(entry['hours'] for entry in schedule[day])
-            avail = slots[day]-used
-            if avail <= 0: continue
-            alloc = min(avail, req)
-            if alloc>0:
-                schedule[day].append({'subject':name,'hours':round(alloc,2)})
+    schedule = {d: {} for d in days}
+    # sort on pre-extracted keys: earliest deadline first, then highest priority
+    decorated = [(meta['deadline'].toordinal(), -meta['priority'], name, meta) for name, meta in subjects_input.items()]
+    decorated.sort()
+    # days are consecutive and sorted, so each subject's window is days[:stop]
+    stops = [bisect.bisect_right(days, meta['deadline']) for _, _, _, meta in decorated]
+    if NUMBA_AVAILABLE:
+        cap = np.array([slots[d] for d in days], dtype=float)
+        names = [name for _, _, name, _ in decorated]
+        req = np.array([remaining[name] for name in names], dtype=float)
+        subj_idx, day_idx, hrs = _allocate_core(cap, req, np.array(stops, dtype=np.int64))
+        for i, j, h in zip(subj_idx.tolist(), day_idx.tolist(), hrs.tolist()):
+            schedule[days[j]][names[i]] = round(h,2)
+        for i, name in enumerate(names):
+            remaining[name] = 0.0 if req[i]<=0.001 else round(float(req[i]),2)
+    elif NUMPY_AVAILABLE:
+        cap = np.array([slots[d] for d in days], dtype=float)
+        for (_, _, name, _), stop in zip(decorated, stops):
+            req = remaining[name]
+            avail = np.maximum(cap[:stop], 0.0)
+            before = np.cumsum(avail) - avail
+            take = np.minimum(avail, np.maximum(req - before, 0.0))
+            cap[:stop] -= take
+            req -= float(take.sum())
+            for j in np.flatnonzero(take > 0.001):
+                schedule[days[j]][name] = round(float(take[j]),2)
+            remaining[name] = 0.0 if req<=0.001 else round(req,2)
+    else:
+        cap = [slots[d] for d in days]
+        for (_, _, name, _), stop in zip(decorated, stops):
+            req = remaining[name]
+            for j in range(stop):
+                if req<=0.001: break
+                if cap[j] <= 0: continue
+                alloc = min(cap[j], req)
+                cap[j] -= alloc
                 req -= alloc
-                remaining[name] = round(req,2)
-                if req<=0.001:
-                    remaining[name]=0.0
-                    break
-    # Secondary pass for remaining
-    for name, rem in list(remaining.items()):
-        if rem>0:
-            for day in schedule.keys():
-                if day > subjects_input[name]['deadline']: break
-                used = sum(entry['hours'] for entry in schedule[day])
-                avail = slots[day]-used
-                if avail<=0: continue
-                alloc = min(avail, rem)
-                schedule[day].append({'subject':name,'hours':round(alloc,2)})
-                rem -= alloc
-                remaining[name] = round(rem,2)
-                if rem<=0.001:
-                    remaining[name]=0.0
-                    break
+                if alloc > 0.001:
+                    schedule[days[j]][name] = round(alloc,2)
+            remaining[name] = 0.0 if req<=0.001 else round(req,2)
+    # No second pass is needed: a subject left with remaining hours has already
+    # used up every day before its deadline, and later subjects only use more.
     return schedule, remaining
 
 # -------------------------
@@ -260,61 +387,38 @@ def allocate_hours_to_schedule(subjects_input, availability, start_date=None):
 def detect_and_redistribute_clashes(schedule, availability):
     if not schedule:
         return schedule
-    # Build free capacity per day
-    free_slots = OrderedDict()
+    # Build free capacity per day once; updated in place as hours move
+    cap_arr = _cap_array(availability)
+    free = {}
     for d in schedule.keys():
-        weekday = d.strftime("%a")
-        total_avail = float(availability.get(weekday, 0))
-        used = sum(entry['hours'] for entry in schedule[d])
-        free_slots[d] = round(total_avail - used, 6)
-
-    # For each day that is overloaded, try to move entries earlier
-    for day in list(schedule.keys()):
-        weekday = day.strftime("%a")
-        total_avail = float(availability.get(weekday, 0))
-        used = sum(entry['hours'] for entry in schedule[day])
-        overload = round(used - total_avail, 6)
-        if overload <= 0.0001:
-            continue
-        for entry in list(schedule[day]):
-            if overload <= 0:
-                break
-            subject = entry['subject']
-            hrs = entry['hours']
-            if hrs <= 0.001:
-                continue
-            move_amount = min(hrs, overload)
-            for prev_day in reversed(list(schedule.keys())):
-                if prev_day >= day:
-                    continue
-                prev_weekday = prev_day.strftime("%a")
-                prev_total_avail = float(availability.get(prev_weekday,0))
-                prev_used = sum(e['hours'] for e in schedule[prev_day])
-                prev_free = round(prev_total_avail - prev_used,6)
-                if prev_free <= 0.0001:
-                    continue
-                take = min(prev_free, move_amount)
-                if take <= 0:
-                    continue
-                schedule[prev_day].append({'subject': subject, 'hours': round(take,2)})
-                entry['hours'] = round(entry['hours'] - take, 2)
-                move_amount = round(move_amount - take, 2)
-                overload = round(overload - take, 2)
-                free_slots[prev_day] = round(prev_free - take, 6)
-                if entry['hours'] <= 0.0001:
-                    try:
-                        schedule[day].remove(entry)
-                    except ValueError:
-                        pass
-                if overload <= 0:
+        free[d] = cap_arr[d.weekday()] - sum(schedule[d].values())
+
+    # Min-heap of days with spare capacity keyed by ordinal: the top is the
+    # earliest free day, and days are popped once they fill up.
+    free_heap = [(d.toordinal(), d) for d in schedule.keys() if free[d] > 0.0001]
+    heapq.heapify(free_heap)
+    for day in schedule.keys():
+        if free[day] < -0.0001:
+            day_ord = day.toordinal()
+            for subject, hrs in list(schedule[day].items()):
+                if free[day] >= -0.0001 or not free_heap or free_heap[0][0] >= day_ord:
                     break
+                if hrs <= 0.001:
+                    continue
+                move_amount = min(hrs, -free[day])
+                while move_amount > 0.0001 and free_heap and free_heap[0][0] < day_ord:
+                    prev_day = free_heap[0][1]
+                    take = min(free[prev_day], move_amount)
+                    schedule[prev_day][subject] = schedule[prev_day].get(subject, 0) + take
+                    schedule[day][subject] -= take
+                    move_amount -= take
+                    free[prev_day] -= take
+                    free[day] += take
+                    if free[prev_day] <= 0.0001:
+                        heapq.heappop(free_heap)
     # Cleanup
     for day in list(schedule.keys()):
-        newlist = []
-        for e in schedule[day]:
-            if e.get('hours',0) > 0.001:
-                newlist.append({'subject': e['subject'], 'hours': round(e['hours'],2)})
-        schedule[day] = newlist
+        schedule[day] = {s: round(h,2) for s, h in schedule[day].items() if h > 0.001}
     return schedule
 
 # -------------------------
@@ -327,20 +431,34 @@ class StudyPlannerGUI:
         self.root.geometry("900x650")
         self.data = sanitize_data(load_data())
         self.predictor = SimplePredictor()
+        self._dirty = False
+        self._schedule_dirty = False
+        self._flush_pending = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.schedule_cache = None
-
-        # If last_generated_schedule exists, try to load it into schedule_cache
-        if self.data.get('last_generated_schedule'):
+        self.schedule_used = {}
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=warm_up_allocator, daemon=True).start()
+
+        saved_schedule = load_schedule()
+        # Older versions kept the schedule inside DATA_FILE; move it out
+        if 'last_generated_schedule' in self.data:
+            legacy = self.data.pop('last_generated_schedule')
+            if not saved_schedule and isinstance(legacy, dict):
+                saved_schedule = legacy
+            self._mark_dirty()
+            self._mark_dirty(schedule=True)
+        if saved_schedule:
             try:
-                s = OrderedDict()
-                for k, v in sorted(self.data['last_generated_schedule'].items()):
+                s = {}
+                for k, v in sorted(saved_schedule.items()):
                     d = parse_date(k)
                     if d:
-                        s[d] = v
+                        s[d] = blocks_from_json(v)
                 if s:
-                    self.schedule_cache = s
+                    self.set_schedule_cache(s)
             except Exception:
-                self.schedule_cache = None
+                self.set_schedule_cache(None)
 
         self.tab_control = ttk.Notebook(root)
         self.tab_subjects = ttk.Frame(self.tab_control)
@@ -355,8 +473,42 @@ class StudyPlannerGUI:
         self.create_schedule_tab()
         self.create_availability_tab()
 
-        # start periodic reminder checks (every 30 seconds)
-        self.root.after(30*1000, self._periodic_check)
+        # arm a single timer for the next due reminder instead of polling
+        self._reminder_after_id = None
+        self._reminders_shown = set()
+        self.schedule_next_reminder()
+
+    def set_schedule_cache(self, schedule):
+        self.schedule_cache = schedule
+        # Hours booked per day, kept in step with schedule_cache so capacity
+        # checks don't have to re-sum a day's blocks
+        self.schedule_used = {d: sum(blocks.values()) for d, blocks in (schedule or {}).items()}
+
+    def _mark_dirty(self, schedule=False):
+        # Coalesce saves: write once when the GUI goes idle rather than per edit.
+        # Schedule changes only rewrite SCHEDULE_FILE.
+        if schedule:
+            self._schedule_dirty = True
+        else:
+            self._dirty = True
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.after_idle(self._flush)
+
+    def _flush(self):
+        self._flush_pending = False
+        if self._dirty:
+            save_data(self.data)
+            self._dirty = False
+        if self._schedule_dirty:
+            save_schedule({d.isoformat(): blocks for d, blocks in (self.schedule_cache or {}).items()})
+            self._schedule_dirty = False
+
+    def _on_close(self):
+        try:
+            self._flush()
+        finally:
+            self.root.destroy()
 
     # -------------------------
     # Subjects Tab
@@ -374,9 +526,10 @@ class StudyPlannerGUI:
 
     def view_subjects(self):
         self.subjects_listbox.delete(0, tk.END)
-        for name, v in sorted(self.data.get('subjects',{}).items()):
-            line = f"{name} | Deadline: {v['deadline']} | Difficulty: {v['difficulty']} | Req hours: {v.get('required_hours','-')} | Score: {v.get('score')} | Past hrs: {v.get('past_hours')}"
-            self.subjects_listbox.insert(tk.END, line)
+        lines = [f"{name} | Deadline: {v['deadline']} | Difficulty: {v['difficulty']} | Req hours: {v.get('required_hours','-')} | Score: {v.get('score')} | Past hrs: {v.get('past_hours')}"
+                 for name, v in sorted(self.data.get('subjects',{}).items())]
+        if lines:
+            self.subjects_listbox.insert(tk.END, *lines)
 
     def add_subject(self):
         name = simpledialog.askstring("Input", "Enter subject name:")
@@ -399,13 +552,13 @@ class StudyPlannerGUI:
         if 'subjects' not in self.data:
             self.data['subjects'] = {}
         self.data['subjects'][name] = {
-            "deadline": dd.strftime("%Y-%m-%d"),
+            "deadline": dd.isoformat(),
             "difficulty": diff,
             "score": score,
             "past_hours": past_hours,
             "required_hours": req_hours
         }
-        save_data(self.data)
+        self._mark_dirty()
         messagebox.showinfo("Added", f"{name} added. Predicted hours: {req_hours}")
         self.view_subjects()
 
@@ -421,7 +574,7 @@ class StudyPlannerGUI:
         self.data['subjects'][name]['score'] = score
         self.data['subjects'][name]['past_hours'] = past_hours
         self.data['subjects'][name]['required_hours'] = req
-        save_data(self.data)
+        self._mark_dirty()
         messagebox.showinfo("Updated", f"Updated required hours: {req}")
         self.view_subjects()
 
@@ -438,7 +591,7 @@ class StudyPlannerGUI:
             if dd is None:
                 messagebox.showerror("Error", "Invalid date!")
                 return
-            subj['deadline'] = dd.strftime("%Y-%m-%d")
+            subj['deadline'] = dd.isoformat()
         diff = simpledialog.askinteger("Edit", f"Difficulty (1-5) current {subj['difficulty']}:", minvalue=1, maxvalue=5)
         if diff:
             subj['difficulty'] = diff
@@ -449,7 +602,7 @@ class StudyPlannerGUI:
             subj['score'] = score
             subj['past_hours'] = past_hours
             subj['required_hours'] = self.predictor.predict(subj['difficulty'], score, past_hours)
-        save_data(self.data)
+        self._mark_dirty()
         messagebox.showinfo("Edited", f"{name} updated.")
         self.view_subjects()
 
@@ -461,7 +614,7 @@ class StudyPlannerGUI:
         if not messagebox.askyesno("Confirm", f"Delete subject {name}?"):
             return
         del self.data['subjects'][name]
-        save_data(self.data)
+        self._mark_dirty()
         messagebox.showinfo("Deleted", f"{name} deleted.")
         self.view_subjects()
 
@@ -519,53 +672,52 @@ class StudyPlannerGUI:
         detect_and_adjust_priorities(subjects_input)
         schedule, remaining = allocate_hours_to_schedule(subjects_input, self.data['availability'])
         schedule = detect_and_redistribute_clashes(schedule, self.data['availability'])
-        self.schedule_cache = schedule
-        # Persist schedule into JSON (convert dates to strings)
-        try:
-            self.data['last_generated_schedule'] = {d.strftime("%Y-%m-%d"): schedule[d] for d in schedule.keys()}
-            save_data(self.data)
-        except Exception:
-            pass
+        self.set_schedule_cache(schedule)
+        self._mark_dirty(schedule=True)
         self.generate_schedule_display_from_cache()
         if any(v>0.001 for v in remaining.values()):
             self.schedule_text.insert(tk.END,"\n⚠ Some subjects could not be fully scheduled. Consider increasing availability or starting earlier.\n")
         else:
             self.schedule_text.insert(tk.END,"\nAll required hours scheduled.\n")
+        self.schedule_next_reminder()
 
     def generate_schedule_display_from_cache(self):
         self.schedule_text.delete("1.0", tk.END)
         if not self.schedule_cache:
             self.schedule_text.insert(tk.END, "No schedule available. Generate a schedule first.\n")
             return
+        # build the whole text first; each Text.insert triggers a relayout
+        parts = []
         for day, blocks in sorted(self.schedule_cache.items()):
             if not blocks: continue
             try:
-                day_str = day.strftime('%Y-%m-%d')
-                dow = day.strftime('%a')
+                day_str = day.isoformat()
+                dow = WDAYS[day.weekday()]
             except Exception:
                 dobj = parse_date(str(day))
                 if dobj:
-                    day_str = dobj.strftime('%Y-%m-%d')
-                    dow = dobj.strftime('%a')
+                    day_str = dobj.isoformat()
+                    dow = WDAYS[dobj.weekday()]
                 else:
                     day_str = str(day)
                     dow = ""
-            self.schedule_text.insert(tk.END, f"\n{day_str} ({dow}):\n")
-            for b in blocks:
-                self.schedule_text.insert(tk.END, f"  - {b['subject']}: {b['hours']} hours\n")
+            parts.append(f"\n{day_str} ({dow}):\n")
+            for subj, hrs in blocks.items():
+                parts.append(f"  - {subj}: {hrs} hours\n")
+        self.schedule_text.insert(tk.END, "".join(parts))
 
     def show_today_plan(self):
         if not self.schedule_cache:
             messagebox.showinfo("Info","Generate schedule first!")
             return
         today = datetime.date.today()
-        blocks = self.schedule_cache.get(today,[])
+        blocks = self.schedule_cache.get(today,{})
         if not blocks:
             messagebox.showinfo("Today's Plan","No study blocks scheduled today.")
             return
         msg = "Today's study plan:\n"
-        for b in blocks:
-            msg += f" - {b['subject']}: {b['hours']} hours\n"
+        for subj, hrs in blocks.items():
+            msg += f" - {subj}: {hrs} hours\n"
         messagebox.showinfo("Today's Plan", msg)
 
     def reschedule_block(self):
@@ -586,12 +738,13 @@ class StudyPlannerGUI:
         if not blocks:
             messagebox.showerror("Error", "No blocks on that date.")
             return
-        subj_names = [f"{i+1}. {b['subject']} ({b['hours']} hrs)" for i,b in enumerate(blocks)]
-        choice = simpledialog.askinteger("Choose block", "Which block to move?\n" + "\n".join(subj_names), minvalue=1, maxvalue=len(blocks))
+        items = list(blocks.items())
+        subj_names = [f"{i+1}. {s} ({h} hrs)" for i,(s,h) in enumerate(items)]
+        choice = simpledialog.askinteger("Choose block", "Which block to move?\n" + "\n".join(subj_names), minvalue=1, maxvalue=len(items))
         if not choice:
             return
-        block = blocks[choice-1]
-        move_hours = simpledialog.askfloat("Hours", f"How many hours to move (max {block['hours']}):", minvalue=0.01, maxvalue=block['hours'])
+        subject, hours = items[choice-1]
+        move_hours = simpledialog.askfloat("Hours", f"How many hours to move (max {hours}):", minvalue=0.01, maxvalue=hours)
         if not move_hours:
             return
         target_str = simpledialog.askstring("Target", "Enter target date (YYYY-MM-DD) to move to:")
@@ -600,29 +753,25 @@ class StudyPlannerGUI:
             messagebox.showerror("Error","Invalid target date")
             return
         if target not in self.schedule_cache:
-            self.schedule_cache[target] = []
-        used = sum(e['hours'] for e in self.schedule_cache[target])
-        weekday = target.strftime("%a")
-        cap = float(self.data['availability'].get(weekday,0))
+            self.schedule_cache[target] = {}
+        used = self.schedule_used.get(target, 0.0)
+        cap = _cap_array(self.data['availability'])[target.weekday()]
         free = cap - used
         if free < 0.01:
             messagebox.showerror("Error","No free capacity on target date.")
             return
         allowed = min(move_hours, free)
-        block['hours'] = round(block['hours'] - allowed,2)
-        if block['hours'] <= 0.001:
-            try:
-                self.schedule_cache[day].remove(block)
-            except ValueError:
-                pass
-        self.schedule_cache[target].append({'subject': block['subject'], 'hours': round(allowed,2)})
-        try:
-            self.data['last_generated_schedule'] = {d.strftime("%Y-%m-%d"): self.schedule_cache[d] for d in self.schedule_cache.keys()}
-            save_data(self.data)
-        except Exception:
-            pass
-        messagebox.showinfo("Moved", f"Moved {allowed} hours of {block['subject']} to {target.strftime('%Y-%m-%d')}")
+        blocks[subject] = round(hours - allowed,2)
+        self.schedule_used[day] = self.schedule_used.get(day, 0.0) - round(allowed,2)
+        self.schedule_used[target] = used + round(allowed,2)
+        if blocks[subject] <= 0.001:
+            del blocks[subject]
+        target_blocks = self.schedule_cache[target]
+        target_blocks[subject] = round(target_blocks.get(subject, 0) + allowed,2)
+        self._mark_dirty(schedule=True)
+        messagebox.showinfo("Moved", f"Moved {allowed} hours of {subject} to {target.isoformat()}")
         self.generate_schedule_display_from_cache()
+        self.schedule_next_reminder()
 
     # -------------------------
     # Availability Tab
@@ -631,7 +780,7 @@ class StudyPlannerGUI:
         frame = self.tab_availability
         ttk.Label(frame, text="Set weekly availability (hours)").pack(pady=5)
         self.av_entries = {}
-        for wd in ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]:
+        for wd in WDAYS:
             row = ttk.Frame(frame)
             row.pack(fill="x", padx=10, pady=2)
             lbl = ttk.Label(row, text=wd, width=6)
@@ -658,7 +807,7 @@ class StudyPlannerGUI:
                 self.data['availability'][wd] = h
             except Exception:
                 self.data['availability'][wd] = 0.0
-        save_data(self.data)
+        self._mark_dirty()
         messagebox.showinfo("Saved","Availability saved.")
 
     # -------------------------
@@ -669,7 +818,7 @@ class StudyPlannerGUI:
             messagebox.showinfo("Info","Generate schedule first!")
             return
         today = datetime.date.today()
-        blocks = self.schedule_cache.get(today,[])
+        blocks = self.schedule_cache.get(today,{})
         if not blocks:
             messagebox.showinfo("Info","No blocks today to set reminders for.")
             return
@@ -678,37 +827,63 @@ class StudyPlannerGUI:
             return
         if 'reminders' not in self.data:
             self.data['reminders'] = {}
-        self.data['reminders'][today.strftime("%Y-%m-%d")] = {'minutes_before': mins, 'set_at': datetime.datetime.now().isoformat()}
-        save_data(self.data)
-        messagebox.showinfo("Reminders set", f"Reminders for {today.strftime('%Y-%m-%d')} set ({mins} minutes before).")
+        self.data['reminders'][today.isoformat()] = {'minutes_before': mins, 'set_at': datetime.datetime.now().isoformat()}
+        self._mark_dirty()
+        messagebox.showinfo("Reminders set", f"Reminders for {today.isoformat()} set ({mins} minutes before).")
         self.check_and_show_reminders()
+        self.schedule_next_reminder()
 
     def check_and_show_reminders(self):
         if 'reminders' not in self.data:
             return
-        today_key = datetime.date.today().strftime("%Y-%m-%d")
+        today_key = datetime.date.today().isoformat()
+        self._reminders_shown.add(today_key)
         r = self.data['reminders'].get(today_key)
         if not r:
             return
         if not self.schedule_cache:
             return
-        blocks = self.schedule_cache.get(datetime.date.today(), [])
+        blocks = self.schedule_cache.get(datetime.date.today(), {})
         if not blocks:
             return
         mins = int(r.get('minutes_before',0))
-        msg = f"Today's study plan ({datetime.date.today().strftime('%Y-%m-%d')}):\n"
-        for b in blocks:
-            msg += f" - {b['subject']}: {b['hours']} hours\n"
+        msg = f"Today's study plan ({datetime.date.today().isoformat()}):\n"
+        for subj, hrs in blocks.items():
+            msg += f" - {subj}: {hrs} hours\n"
         if mins == 0:
             messagebox.showinfo("Reminder", msg)
         else:
             messagebox.showinfo("Upcoming Reminder", f"In {mins} minutes you'll have study blocks.\n\n" + msg)
 
-    def _periodic_check(self):
+    def _next_reminder_ms(self):
+        """Milliseconds until the next reminder is due, or None if none is pending."""
+        reminders = self.data.get('reminders') or {}
+        now = datetime.datetime.now()
+        today_key = now.date().isoformat()
+        if today_key in reminders and today_key not in self._reminders_shown:
+            return 0
+        upcoming = [d for d in (parse_date(k) for k in reminders) if d and d > now.date()]
+        if not upcoming:
+            return None
+        # reminders for a later day become due when that day starts; re-arm at
+        # least daily so a suspended machine or clock change can't skip one
+        due = datetime.datetime.combine(min(upcoming), datetime.time())
+        return min(int((due - now).total_seconds() * 1000) + 1, 24*60*60*1000)
+
+    def schedule_next_reminder(self):
+        if self._reminder_after_id is not None:
+            self.root.after_cancel(self._reminder_after_id)
+            self._reminder_after_id = None
+        delay = self._next_reminder_ms()
+        if delay is not None:
+            self._reminder_after_id = self.root.after(delay, self._fire_next_reminder)
+
+    def _fire_next_reminder(self):
+        self._reminder_after_id = None
         try:
             self.check_and_show_reminders()
         finally:
-            self.root.after(30*1000, self._periodic_check)
+            self.schedule_next_reminder()
 
 # -------------------------
 # Run app